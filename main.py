@@ -1,10 +1,62 @@
 import os
 import json
+import pickle
+import shutil
 import logging
-from datetime import datetime
-from collections import defaultdict
+import tempfile
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
+from collections import Counter
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 import xlsxwriter
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library parser
+    orjson = None
+
+
+# Buffer size for reading and copying JSON files; larger than the 8 KiB default to cut read() syscalls
+IO_BUFFER_SIZE = 1 << 20
+
+# Report sheets with more rows than this get no pie chart, as it would be unreadable and slow to write
+MAX_CHART_ITEMS = 30
+
+# Files in the input folder caching which split files have up-to-date statistics, and those statistics
+STATS_CACHE_FILE = '.analysis_cache'
+STATS_FILE_SUFFIX = '.stats.pickle'
+
+# Bump whenever analyze_data changes what it computes, so that cached statistics are discarded
+STATS_CACHE_VERSION = 1
+
+# Mapping of custom field IDs to their names
+FIELD_ID_TO_NAME = {
+    38954747: 'channel',
+    38829288: 'type_of_inquiry',
+    38830788: 'program_area',
+    1500001654502: 'segment',
+}
+KNOWN_FIELD_IDS = frozenset(FIELD_ID_TO_NAME)
+
+
+if orjson is not None:
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        """
+        Serialize obj to single-line JSON bytes.
+        """
+        return orjson.dumps(obj)
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        """
+        Serialize obj to single-line JSON bytes.
+        """
+        return json.dumps(obj).encode('utf-8')
+
 
 def setup_logger(log_file):
     """
@@ -27,6 +79,17 @@ def setup_logger(log_file):
     logger.addHandler(ch)
 
 
+def init_worker_logging(log_queue, level):
+    """
+    Send the log records of a worker process to the parent process through log_queue.
+    """
+    logger = logging.getLogger()
+    # Handlers inherited on fork would otherwise write to the log file alongside the parent
+    logger.handlers.clear()
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+
+
 def process_file(file_path):
     """
     Process a single JSON file and return the data entries.
@@ -34,10 +97,22 @@ def process_file(file_path):
     logging.info(f"Processing file: {os.path.basename(file_path)}")
     data_entries = []
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        for line in f:
+    with open(file_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        lines = f
+
+        # A file holding a single JSON array is parsed in one go rather than line by line
+        if f.peek(1).lstrip()[:1] == b'[':
+            content = f.read()
+            try:
+                return json_loads(content)
+            except json.JSONDecodeError:
+                # Not a single array, e.g. one array per line
+                lines = content.splitlines()
+
+        for line in lines:
             try:
-                data = json.loads(line.strip())
+                # Both parsers accept raw UTF-8 bytes and surrounding whitespace
+                data = json_loads(line)
                 if isinstance(data, list):
                     data_entries.extend(data)
                 else:
@@ -47,112 +122,225 @@ def process_file(file_path):
     return data_entries
 
 
+def count_lines(file_path):
+    """
+    Count the lines of a file, i.e. the entries of an NDJSON file.
+    """
+    with open(file_path, 'rb') as f:
+        return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(IO_BUFFER_SIZE), b''))
+
+
 def analyze_data(data_entries):
     """
     Analyze the list of data entries and return statistics.
     """
-    created_at_year_count = defaultdict(int)
-    tags_count = defaultdict(int)
-    program_area_count = defaultdict(int)
-    segment_count = defaultdict(int)
-    channel_count = defaultdict(int)
-    type_of_inquiry_count = defaultdict(int)
+    created_at_prefix_count = Counter()
+    tags_count = Counter()
+    program_area_count = Counter()
+    segment_count = Counter()
+    channel_count = Counter()
+    type_of_inquiry_count = Counter()
     spam_ticket_count = 0
-    unique_tags = set()
-    unique_program_areas = set()
-    unique_segments = set()
-    unique_channels = set()
-    unique_types_of_inquiry = set()
-
-    # Mapping of custom field IDs to their names
-    FIELD_ID_TO_NAME = {
-        38954747: 'channel',
-        38829288: 'type_of_inquiry',
-        38830788: 'program_area',
-        1500001654502: 'segment',
+
+    # Dispatch table from custom field ID to the counter it feeds
+    field_count_by_name = {
+        'channel': channel_count,
+        'type_of_inquiry': type_of_inquiry_count,
+        'program_area': program_area_count,
+        'segment': segment_count,
     }
+    field_dispatch = {field_id: field_count_by_name[name] for field_id, name in FIELD_ID_TO_NAME.items()}
 
     for entry in data_entries:
         # Count the number of tickets per "created_at" year
-        if 'created_at' in entry:
-            try:
-                year = datetime.strptime(entry['created_at'], "%Y-%m-%dT%H:%M:%S.%fZ").year
-                created_at_year_count[year] += 1
-            except ValueError:
-                try:
-                    year = datetime.strptime(entry['created_at'], "%Y-%m-%dT%H:%M:%S.%f%z").year
-                    created_at_year_count[year] += 1
-                except ValueError:
-                    logging.warning(f"Invalid date format for entry: {entry.get('created_at')}")
+        created_at = entry.get('created_at')
+        if created_at is not None:
+            # Zendesk timestamps are ISO 8601 ("YYYY-MM-DDT..."), so the year is the first four characters.
+            # Count the raw prefix here and convert it to an int once per distinct year below.
+            if len(created_at) >= 10 and created_at[4] == '-':
+                created_at_prefix_count[created_at[:4]] += 1
+            else:
+                logging.warning(f"Invalid date format for entry: {created_at}")
 
         # Collect tags and count occurrences
-        tags = entry.get('tags', [])
-        if tags:
-            for tag in tags:
-                tags_count[tag] += 1
-                unique_tags.add(tag)
+        tags_count.update(entry.get('tags') or ())
 
         # Collect program_area, segment, channel, and type_of_inquiry from custom_fields
-        custom_fields = entry.get('custom_fields', [])
-        program_area = None
-        segment = None
-        channel = None
-        type_of_inquiry = None
+        has_program_area = False
 
-        for field in custom_fields:
+        for field in entry.get('custom_fields') or ():
+            # Most custom fields are not tracked, so skip them before looking at their value
             field_id = field.get('id')
+            if field_id not in KNOWN_FIELD_IDS:
+                continue
             field_value = field.get('value')
-            field_name = FIELD_ID_TO_NAME.get(field_id)
-            if field_name == 'program_area':
-                program_area = field_value
-                if program_area:
-                    program_area_count[program_area] += 1
-                    unique_program_areas.add(program_area)
-            elif field_name == 'segment':
-                segment = field_value
-                if segment:
-                    segment_count[segment] += 1
-                    unique_segments.add(segment)
-            elif field_name == 'channel':
-                channel = field_value
-                if channel:
-                    channel_count[channel] += 1
-                    unique_channels.add(channel)
-            elif field_name == 'type_of_inquiry':
-                type_of_inquiry = field_value
-                if type_of_inquiry:
-                    type_of_inquiry_count[type_of_inquiry] += 1
-                    unique_types_of_inquiry.add(type_of_inquiry)
-
-        if not program_area:
+            if not field_value:
+                continue
+            field_count = field_dispatch[field_id]
+            field_count[field_value] += 1
+            if field_count is program_area_count:
+                has_program_area = True
+
+        # Tickets without a program area are considered spam
+        if not has_program_area:
             spam_ticket_count += 1
 
+    created_at_year_count = Counter()
+    for prefix, count in created_at_prefix_count.items():
+        # isdigit() alone also accepts digits such as '²' that int() rejects
+        if prefix.isascii() and prefix.isdigit():
+            created_at_year_count[int(prefix)] = count
+        else:
+            logging.warning(f"Invalid date format for {count} entries with year {prefix!r}")
+
     # Compile the analysis results
     analysis_stats = {
         'total_tickets': len(data_entries),
-        'created_at_year_count': dict(created_at_year_count),
-        'tags_count': dict(tags_count),
-        'program_area_count': dict(program_area_count),
-        'segment_count': dict(segment_count),
-        'channel_count': dict(channel_count),
-        'type_of_inquiry_count': dict(type_of_inquiry_count),
+        'created_at_year_count': created_at_year_count,
+        'tags_count': tags_count,
+        'program_area_count': program_area_count,
+        'segment_count': segment_count,
+        'channel_count': channel_count,
+        'type_of_inquiry_count': type_of_inquiry_count,
         'spam_ticket_count': spam_ticket_count,
-        'unique_tags': unique_tags,
-        'unique_program_areas': unique_program_areas,
-        'unique_segments': unique_segments,
-        'unique_channels': unique_channels,
-        'unique_types_of_inquiry': unique_types_of_inquiry,
+        'unique_tags': set(tags_count),
+        'unique_program_areas': set(program_area_count),
+        'unique_segments': set(segment_count),
+        'unique_channels': set(channel_count),
+        'unique_types_of_inquiry': set(type_of_inquiry_count),
     }
 
     return analysis_stats
 
 
+def write_entries_file(file_path, data_entries):
+    """
+    Serialize data entries as NDJSON (one entry per line) to a temporary file next
+    to file_path and return its path.
+    """
+    fd, entries_file = tempfile.mkstemp(suffix='.part', dir=os.path.dirname(file_path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.writelines(json_dumps(entry) + b'\n' for entry in data_entries)
+    except BaseException:
+        # Never leave a partial copy of the sensitive ticket data behind
+        os.remove(entries_file)
+        raise
+    return entries_file
+
+
+def analyze_one(file_path, collect_entries):
+    """
+    Process and analyze a single split file. Runs in a worker process.
+
+    Returns the analysis statistics and, if collect_entries is set, the path of a
+    temporary file holding the file's serialized entries (otherwise None).
+    """
+    data_entries = process_file(file_path)
+    analysis_stats = analyze_data(data_entries)
+    # Serialize last, so that a failing analysis never leaves a temporary file behind
+    entries_file = write_entries_file(file_path, data_entries) if collect_entries else None
+    return analysis_stats, entries_file
+
+
+def export_one(file_path):
+    """
+    Process a single split file for collation. Runs in a worker process.
+
+    Returns the path of a temporary file holding the file's serialized entries.
+    """
+    return write_entries_file(file_path, process_file(file_path))
+
+
+def stats_cache_version():
+    """
+    Return the version of the statistics cache, covering both the analysis logic and the tracked custom fields.
+    """
+    return [STATS_CACHE_VERSION, [[field_id, name] for field_id, name in sorted(FIELD_ID_TO_NAME.items())]]
+
+
+def load_stats_cache(input_folder):
+    """
+    Load the cache mapping split file names to the (mtime_ns, size) their cached statistics were computed from.
+    """
+    cache_file = os.path.join(input_folder, STATS_CACHE_FILE)
+    if not os.path.exists(cache_file):
+        return {}
+    try:
+        with open(cache_file, 'rb') as f:
+            stats_cache = json_loads(f.read())
+    except ValueError as e:
+        logging.warning(f"Ignoring unreadable statistics cache {cache_file}: {e}")
+        return {}
+
+    if not isinstance(stats_cache, dict) or stats_cache.get('version') != stats_cache_version():
+        logging.info("Statistics cache is from a different analysis version. Re-analyzing all files.")
+        return {}
+    return stats_cache['files']
+
+
+def save_stats_cache(input_folder, stats_cache):
+    """
+    Save the cache mapping split file names to the (mtime_ns, size) their cached statistics were computed from,
+    and remove the cached statistics of split files that no longer exist.
+    """
+    with open(os.path.join(input_folder, STATS_CACHE_FILE), 'wb') as f:
+        f.write(json_dumps({'version': stats_cache_version(), 'files': stats_cache}))
+
+    for name in os.listdir(input_folder):
+        if not (name.startswith('.') and name.endswith(STATS_FILE_SUFFIX)):
+            continue
+        if name[1:-len(STATS_FILE_SUFFIX)] not in stats_cache:
+            os.remove(os.path.join(input_folder, name))
+
+
+def stats_file_path(input_folder, filename):
+    """
+    Return the path of the pickled analysis statistics cached for a split file.
+    """
+    return os.path.join(input_folder, f".{filename}{STATS_FILE_SUFFIX}")
+
+
+def load_cached_stats(stats_file):
+    """
+    Load pickled analysis statistics, returning None if they cannot be read.
+    """
+    try:
+        with open(stats_file, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:  # A corrupt pickle can raise almost any exception
+        logging.warning(f"Ignoring unreadable cached statistics {stats_file}: {e}")
+        return None
+
+
+def merge_stats(combined_stats, analysis_stats):
+    """
+    Merge the statistics of one analysis into another and return the combined statistics.
+    """
+    combined_stats['total_tickets'] += analysis_stats['total_tickets']
+    combined_stats['spam_ticket_count'] += analysis_stats['spam_ticket_count']
+
+    for key in ('created_at_year_count', 'tags_count', 'program_area_count',
+                'segment_count', 'channel_count', 'type_of_inquiry_count'):
+        combined_stats[key].update(analysis_stats[key])
+
+    for key in ('unique_tags', 'unique_program_areas', 'unique_segments',
+                'unique_channels', 'unique_types_of_inquiry'):
+        combined_stats[key] |= analysis_stats[key]
+
+    return combined_stats
+
+
 def write_analysis_to_excel(analysis_stats, analysis_file):
     """
     Write the analysis statistics to an Excel file with multiple sheets.
     """
     logging.info(f"Writing analysis to Excel file: {analysis_file}")
-    workbook = xlsxwriter.Workbook(analysis_file)
+    # Flush each row to a temporary file once the next row is started, so memory stays flat for large reports
+    workbook = xlsxwriter.Workbook(analysis_file, {
+        'constant_memory': True,
+        'tmpdir': os.path.dirname(os.path.abspath(analysis_file)),
+    })
 
     # Define formats
     header_format = workbook.add_format({
@@ -167,27 +355,22 @@ def write_analysis_to_excel(analysis_stats, analysis_file):
 
     # Sheet 1: Overview
     overview_sheet = workbook.add_worksheet("Overview")
-    row = 0
 
     # Write headers
-    overview_sheet.write(row, 0, 'Metric', header_format)
-    overview_sheet.write(row, 1, 'Value', header_format)
-    row += 1
-
-    # Total tickets and spam tickets
-    overview_sheet.write(row, 0, 'Total number of tickets', cell_format)
-    overview_sheet.write(row, 1, analysis_stats['total_tickets'], cell_format)
-    row += 1
-
-    overview_sheet.write(row, 0, 'Number of spam tickets', cell_format)
-    overview_sheet.write(row, 1, analysis_stats['spam_ticket_count'], cell_format)
-    row += 1
-
-    # Yearly stats
-    for year, count in sorted(analysis_stats['created_at_year_count'].items()):
-        overview_sheet.write(row, 0, f'Number of tickets for year {year}', cell_format)
-        overview_sheet.write(row, 1, count, cell_format)
-        row += 1
+    overview_sheet.write_row(0, 0, ('Metric', 'Value'), header_format)
+
+    # Total tickets, spam tickets and yearly stats
+    overview_rows = [
+        ('Total number of tickets', analysis_stats['total_tickets']),
+        ('Number of spam tickets', analysis_stats['spam_ticket_count']),
+    ]
+    overview_rows.extend(
+        (f'Number of tickets for year {year}', count)
+        for year, count in sorted(analysis_stats['created_at_year_count'].items())
+    )
+    # Batch rows with write_row; constant memory mode requires row-by-row order, which rules out write_column
+    for row, values in enumerate(overview_rows, 1):
+        overview_sheet.write_row(row, 0, values, cell_format)
 
     # Adjust column width
     overview_sheet.set_column('A:A', 50)
@@ -221,35 +404,33 @@ def write_report_sheet(workbook, worksheet, column_title, data_dict, header_form
     """
     Helper function to write data to a worksheet.
     """
-    worksheet.write(0, 0, column_title, header_format)
-    worksheet.write(0, 1, 'Count', header_format)
+    worksheet.write_row(0, 0, (column_title, 'Count'), header_format)
 
-    total = sum(data_dict.values())
-    row = 1
-    for key, count in sorted(data_dict.items(), key=lambda x: x[1], reverse=True):
-        worksheet.write(row, 0, key, cell_format)
-        worksheet.write(row, 1, count, cell_format)
-        row += 1
+    # Rows must be written in order in constant memory mode, so sort once up front
+    items = sorted(data_dict.items(), key=itemgetter(1), reverse=True)
+    last_row = len(items)
+    for row, item in enumerate(items, 1):
+        worksheet.write_row(row, 0, item, cell_format)
 
     # Write total
-    worksheet.write(row, 0, 'Total', header_format)
-    worksheet.write(row, 1, total, header_format)
+    worksheet.write_row(last_row + 1, 0, ('Total', sum(data_dict.values())), header_format)
 
     # Adjust column width
     worksheet.set_column('A:A', 30)
     worksheet.set_column('B:B', 15)
 
     # Add a chart
-    chart = workbook.add_chart({'type': 'pie'})
-    chart.add_series({
-        'name': f'{column_title} Distribution',
-        'categories': [worksheet.name, 1, 0, row - 1, 0],
-        'values':     [worksheet.name, 1, 1, row - 1, 1],
-        'data_labels': {'percentage': True},
-    })
-    chart.set_title({'name': f'{column_title} Distribution'})
-    chart.set_style(10)
-    worksheet.insert_chart('D2', chart)
+    if len(items) <= MAX_CHART_ITEMS:
+        chart = workbook.add_chart({'type': 'pie'})
+        chart.add_series({
+            'name': f'{column_title} Distribution',
+            'categories': [worksheet.name, 1, 0, last_row, 0],
+            'values':     [worksheet.name, 1, 1, last_row, 1],
+            'data_labels': {'percentage': True},
+        })
+        chart.set_title({'name': f'{column_title} Distribution'})
+        chart.set_style(10)
+        worksheet.insert_chart('D2', chart)
 
 
 def collate_and_analyze_json_files(input_folder, output_file, combined_analysis_file):
@@ -257,48 +438,121 @@ def collate_and_analyze_json_files(input_folder, output_file, combined_analysis_
     Collate JSON files from the input folder, analyze both individual and combined data,
     and export the analysis to Excel files.
     """
-    all_data = []
     split_files = [f for f in os.listdir(input_folder) if f.endswith('.json')]
 
     if not split_files:
         logging.error("No JSON files found in the input folder.")
         return
 
-    # Process each split file individually
+    # Reuse the cached statistics of split files that have not changed since the last run
+    stats_cache = load_stats_cache(input_folder)
+    new_stats_cache = {}
+    split_stats = {}
     for filename in split_files:
-        file_path = os.path.join(input_folder, filename)
-        data_entries = process_file(file_path)
-        all_data.extend(data_entries)
-
-        # Analyze and export analysis for each split file
-        analysis_stats = analyze_data(data_entries)
-        split_analysis_file = f"{os.path.splitext(filename)[0]}_analysis.xlsx"
-        write_analysis_to_excel(analysis_stats, os.path.join(input_folder, split_analysis_file))
-
-    # Validate the combined data count
-    total_split_entries = len(all_data)
-    existing_data_count = 0
-
-    # Check if the output file already exists
-    if os.path.exists(output_file):
-        logging.info(f"{output_file} already exists. Verifying the integrity of the collated data...")
-        with open(output_file, 'r', encoding='utf-8') as f:
-            existing_data = json.load(f)
-        existing_data_count = len(existing_data)
-
-        if existing_data_count == total_split_entries:
-            logging.info("The collated data is complete. Skipping re-collation.")
-        else:
-            logging.warning("The collated data does not match the split files. Re-collating data...")
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(all_data, f, indent=2)
-    else:
-        logging.info("Writing combined JSON data to output file...")
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, indent=2)
-
-    # Analyze and export analysis for the combined data
-    combined_analysis_stats = analyze_data(all_data)
+        st = os.stat(os.path.join(input_folder, filename))
+        file_key = [st.st_mtime_ns, st.st_size]
+        new_stats_cache[filename] = file_key
+        stats_file = stats_file_path(input_folder, filename)
+        if stats_cache.get(filename) == file_key and os.path.exists(stats_file):
+            analysis_stats = load_cached_stats(stats_file)
+            if analysis_stats is not None:
+                logging.info(f"Using cached analysis for file: {filename}")
+                split_stats[filename] = analysis_stats
+
+    changed_files = [f for f in split_files if f not in split_stats]
+    # Without an existing output file it will be written, so changed files can be serialized in the same parse
+    collect_entries = not os.path.exists(output_file)
+    entries_files = {}
+    analyze_futures = []
+    export_futures = []
+    tmp_output_file = f"{output_file}.tmp"
+
+    # Worker processes log through a queue that the parent drains into its own handlers
+    root_logger = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    log_listener = QueueListener(log_queue, *root_logger.handlers, respect_handler_level=True)
+    log_listener.start()
+    try:
+        # Split files are independent, so process and analyze them in parallel
+        with ProcessPoolExecutor(initializer=init_worker_logging, initargs=(log_queue, root_logger.level)) as executor:
+            for filename in changed_files:
+                analyze_futures.append(
+                    executor.submit(analyze_one, os.path.join(input_folder, filename), collect_entries))
+            for filename, future in zip(changed_files, analyze_futures):
+                analysis_stats, entries_file = future.result()
+                if entries_file is not None:
+                    entries_files[filename] = entries_file
+                split_stats[filename] = analysis_stats
+                with open(stats_file_path(input_folder, filename), 'wb') as f:
+                    pickle.dump(analysis_stats, f)
+
+            save_stats_cache(input_folder, new_stats_cache)
+
+            # Start from empty statistics so that merging never modifies a split file's statistics
+            combined_analysis_stats = analyze_data([])
+            for filename in split_files:
+                analysis_stats = split_stats[filename]
+
+                # Export analysis for each split file
+                split_analysis_file = os.path.join(input_folder, f"{os.path.splitext(filename)[0]}_analysis.xlsx")
+                if filename in changed_files or not os.path.exists(split_analysis_file):
+                    write_analysis_to_excel(analysis_stats, split_analysis_file)
+
+                # Fold the split file statistics into the combined statistics
+                combined_analysis_stats = merge_stats(combined_analysis_stats, analysis_stats)
+
+            # Validate the combined data count
+            total_split_entries = combined_analysis_stats['total_tickets']
+            existing_data_count = 0
+            write_output = True
+
+            # Check if the output file already exists
+            if os.path.exists(output_file):
+                logging.info(f"{output_file} already exists. Verifying the integrity of the collated data...")
+                existing_data_count = count_lines(output_file)
+
+                if existing_data_count == total_split_entries:
+                    logging.info("The collated data is complete. Skipping re-collation.")
+                    write_output = False
+                else:
+                    logging.warning("The collated data does not match the split files. Re-collating data...")
+            else:
+                logging.info("Writing combined JSON data to output file...")
+
+            if write_output:
+                # Split files without serialized entries (cached, or checked against an existing output) are
+                # read again. Record each future as soon as it is submitted, so a failing submit still cleans up
+                # earlier exports.
+                export_futures_by_file = {}
+                for filename in split_files:
+                    if filename not in entries_files:
+                        future = executor.submit(export_one, os.path.join(input_folder, filename))
+                        export_futures.append(future)
+                        export_futures_by_file[filename] = future
+
+                # Stream the combined NDJSON to a temporary file, one split file at a time
+                with open(tmp_output_file, 'wb') as combined:
+                    for filename in split_files:
+                        if filename in entries_files:
+                            entries_file = entries_files[filename]
+                        else:
+                            entries_file = export_futures_by_file[filename].result()
+                        with open(entries_file, 'rb') as entries:
+                            shutil.copyfileobj(entries, combined, IO_BUFFER_SIZE)
+                os.replace(tmp_output_file, output_file)
+    finally:
+        log_listener.stop()
+        # The executor has shut down here, so every submitted task has either finished or been cancelled
+        for future in analyze_futures:
+            if not future.cancelled() and future.exception() is None and future.result()[1] is not None:
+                os.remove(future.result()[1])
+        for future in export_futures:
+            if not future.cancelled() and future.exception() is None:
+                os.remove(future.result())
+        if os.path.exists(tmp_output_file):
+            os.remove(tmp_output_file)
+
+    # Export analysis for the combined data
     write_analysis_to_excel(combined_analysis_stats, combined_analysis_file)
 
     # Perform validation checks
@@ -327,7 +581,7 @@ def collate_and_analyze_json_files(input_folder, output_file, combined_analysis_
 
 if __name__ == "__main__":
     input_folder = "./json_files"  # Folder containing JSON files
-    output_file = "combined.json"  # Output file for combined JSON
+    output_file = "combined.ndjson"  # Output file for combined JSON, one ticket per line
     combined_analysis_file = "combined_analysis.xlsx"  # Output file for combined analysis
     log_file = "collate_json_files.log"  # Log file for verbose output
 